@@ -2,10 +2,17 @@
 
 import collections
 import datetime
-import distutils
 import fnmatch
+import re
 
-__all__ = ['Converter', 'bools', 'dates', 'datetimes']
+__all__ = ['Converter', 'bools', 'dates', 'datetimes', 'parse_bool']
+
+# same truth values as accepted by distutils.util.strtobool
+_TRUTH_VALUES = {
+    'y': True, 'yes': True, 't': True, 'true': True, 'on': True, '1': True,
+    'n': False, 'no': False, 'f': False, 'false': False, 'off': False,
+    '0': False,
+}
 
 
 class Converter(collections.namedtuple('_', 'key customize reset')):
@@ -67,6 +74,34 @@ class Converter(collections.namedtuple('_', 'key customize reset')):
                "reset='{self.reset.__name__}')".format(self=self)
 
 
+def parse_bool(value):
+    """Convert a string representation of truth to True or False.
+
+    True values are 'y', 'yes', 't', 'true', 'on', and '1'; false values
+    are 'n', 'no', 'f', 'false', 'off', and '0'. The comparison is case
+    insensitive.
+
+    Args:
+        value (str): The string that shall be converted.
+
+    Returns:
+        bool: The truth value of the string.
+
+    Raises:
+        ValueError: If the string is not a known truth value.
+
+    Examples:
+        >>> parse_bool('Yes')
+        True
+        >>> parse_bool('off')
+        False
+    """
+    try:
+        return _TRUTH_VALUES[value.lower()]
+    except KeyError:
+        raise ValueError('invalid truth value %r' % (value,))
+
+
 def bools(key):
     """Convert between strings and bools
 
@@ -77,9 +112,14 @@ def bools(key):
         A converter object that turns strings into True and False or
         booleans to strings.
     """
-    @_copy_docs(distutils.util.strtobool)
     def to_bool(value):
-        return bool(distutils.util.strtobool(value))
+        """Convert a string representation of truth to True or False.
+
+        True values are 'y', 'yes', 't', 'true', 'on', and '1'; false
+        values are 'n', 'no', 'f', 'false', 'off', and '0'. Raises
+        ValueError if 'value' is anything else.
+        """
+        return parse_bool(value)
 
     return Converter(key, to_bool, str)
 
@@ -97,9 +137,11 @@ def dates(key, fmt='%Y-%m-%d'):
 
     .. _strptime and strftime format: https://docs.python.org/3/library/datetime.html#strftime-strptime-behavior
     """  # noqa: E501
+    parse = _make_parser(fmt)
+
     @_copy_docs(datetime.datetime.strptime)
     def to_obj(date_str):
-        return datetime.datetime.strptime(date_str, fmt).date()
+        return parse(date_str).date()
 
     @_copy_docs(datetime.datetime.strftime)
     def to_str(date_obj):
@@ -121,9 +163,11 @@ def datetimes(key, fmt='%Y-%m-%dT%H:%M:%S'):
 
     .. _strptime and strftime format: https://docs.python.org/3/library/datetime.html#strftime-strptime-behavior
     """  # noqa: E501
+    parse = _make_parser(fmt)
+
     @_copy_docs(datetime.datetime.strptime)
     def to_obj(date_str):
-        return datetime.datetime.strptime(date_str, fmt)
+        return parse(date_str)
 
     @_copy_docs(datetime.datetime.strftime)
     def to_str(datetime_obj):
@@ -132,6 +176,69 @@ def datetimes(key, fmt='%Y-%m-%dT%H:%M:%S'):
     return Converter(key, to_obj, to_str)
 
 
+# numeric strptime directives that can be parsed with a simple regex
+_FAST_DIRECTIVES = {
+    'Y': r'(?P<year>\d\d\d\d)',
+    'm': r'(?P<month>\d\d?)',
+    'd': r'(?P<day>\d\d?)',
+    'H': r'(?P<hour>\d\d?)',
+    'M': r'(?P<minute>\d\d?)',
+    'S': r'(?P<second>\d\d?)',
+}
+
+
+# datetime arguments in order with the defaults that strptime uses
+_FIELDS = (('year', 1900), ('month', 1), ('day', 1),
+           ('hour', 0), ('minute', 0), ('second', 0))
+
+
+def _make_parser(fmt):
+    # strptime translates and matches the format on every call. Formats
+    # that only consist of numeric directives and literal characters are
+    # compiled once instead. Everything else and all values that do not
+    # match are left to strptime so that its behavior and error messages
+    # stay the same.
+    strptime = datetime.datetime.strptime
+    pattern = _compile_format(fmt)
+
+    if pattern is None:
+        return lambda value: strptime(value, fmt)
+
+    def parse(value):
+        match = pattern.match(value)
+        if match:
+            fields = match.groupdict()
+            try:
+                return datetime.datetime(*[int(fields.get(name, default))
+                                           for name, default in _FIELDS])
+            except ValueError:
+                pass
+        return strptime(value, fmt)
+
+    return parse
+
+
+def _compile_format(fmt):
+    parts = []
+    seen = set()
+    chars = iter(fmt)
+
+    for char in chars:
+        if char == '%':
+            directive = next(chars, None)
+            if directive not in _FAST_DIRECTIVES or directive in seen:
+                return None
+            seen.add(directive)
+            parts.append(_FAST_DIRECTIVES[directive])
+        elif char.isspace():
+            # strptime matches any amount of whitespace here
+            return None
+        else:
+            parts.append(re.escape(char))
+
+    return re.compile(''.join(parts) + r'\Z')
+
+
 def _copy_docs(from_fn):
     def wrapper(to_fn):
         to_fn.__doc__ = from_fn.__doc__
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 
 import collections
+import functools
+import operator
 import re
+import weakref
 
 import six
 
@@ -9,6 +12,9 @@ from .. import converters
 
 __all__ = ['Source']
 
+# the maximum number of groups in a regex before python 3.5
+_MAX_GROUPS = 100
+
 
 MetaInfo = collections.namedtuple('MetaInfo', 'readonly is_typed source_name')
 
@@ -23,14 +29,29 @@ class SourceMeta(type):
             msg = '%s is missing the required "_read" method' % name
             raise NotImplementedError(msg)
 
+        # only classes that implement _read hold data on their own.
+        # Everything else is used for subsections which get their data
+        # from the root source.
+        if '_read' in dct:
+            dct.setdefault('_reads_data', True)
+
         user_meta = dct.get('Meta')
 
-        dct['_meta'] = MetaInfo(
+        # the meta information will be copied to every instance where
+        # it can be overridden by subsections
+        dct['_default_meta'] = MetaInfo(
             readonly='_write' not in dct,
             source_name=name,
             is_typed=getattr(user_meta, 'is_typed', True)
         )
 
+        # collect the slots of the whole class hierarchy so that they
+        # can be told apart from keys when setting attributes
+        slots = set(dct.get('__slots__', ()))
+        for base in bases:
+            slots.update(getattr(base, '_slots', ()))
+        dct['_slots'] = frozenset(slots)
+
         return super(SourceMeta, self).__new__(self, name, bases, dct)
 
     def __call__(cls, *args, **kwargs):
@@ -42,16 +63,32 @@ class SourceMeta(type):
 @six.add_metaclass(SourceMeta)
 class AbstractSource(object):
 
-    _initialized = False
+    # subsections create a new source object on every access so they
+    # should be as lightweight as possible. The mixins cannot define
+    # their own slots as multiple bases with slots conflict with each
+    # other. Therefore all slots are defined here.
+    __slots__ = (
+        '_initialized', '_keychain', '_parent', '_meta', '_kwargs',
+        '_use_cache', '_cache', '_cached_values', '_add_subsection',
+        '_converters', '_converter_section', '_locked', '_write_error',
+        '_subsections', '__weakref__',
+    )
+
+    # the default _read below does not provide any data
+    _reads_data = False
+
+    def __new__(cls, *args, **kwargs):
+        # slots have no class level default so it needs to be set
+        # before subclasses start to set attributes in __init__
+        instance = super(AbstractSource, cls).__new__(cls)
+        object.__setattr__(instance, '_initialized', False)
+        return instance
 
     def __init__(self, **kwargs):
         self._keychain = kwargs.pop('keychain', ())
         self._parent = kwargs.pop('parent', None)
-
-        # kwargs.get would override the metaclass settings
-        # so only change it if it's really given.
-        if 'meta' in kwargs:
-            self._meta = kwargs.pop('meta')
+        self._meta = kwargs.pop('meta', self._default_meta)
+        self._subsections = None
 
         # save leftover kwargs to pass them to subsource instances
         # mixins can make use of that to apply attributes to subsources.
@@ -144,13 +181,9 @@ class AbstractSource(object):
         self._set_data(data)
 
     def __getitem__(self, key):
-        attr = self._get_data()[key]
+        attr = self._get_value(key)
         if isinstance(attr, dict):
-            return Source(parent=self,
-                          keychain=self._keychain + (key,),
-                          meta=self._meta,
-                          **self._kwargs
-                          )
+            return self._get_subsection(key)
         return attr
 
     def __setitem__(self, key, value):
@@ -168,10 +201,14 @@ class AbstractSource(object):
         self._set_data(data)
 
     def __len__(self):
-        return len(self._get_data().keys())
+        return len(self._get_data())
 
     def __iter__(self):
-        return iter(self._get_data().keys())
+        return iter(self._get_data())
+
+    def __contains__(self, key):
+        # check the data directly instead of iterating over all keys
+        return key in self._get_data()
 
     def __eq__(self, other):
         return self._get_data() == other
@@ -187,10 +224,47 @@ class AbstractSource(object):
         Using double underscores should prevent name clashes with
         user defined keys.
         """
-        try:
+        if self._reads_data:
             return self._read()
-        except NotImplementedError:
-            return self._parent._get_data()[self._uplink_key]
+        return self._parent._get_value(self._uplink_key)
+
+    def _get_value(self, key):
+        """Proxies a single value of the underlying data source"""
+        if self._reads_data:
+            return self._read_key(key)
+
+        # subsections do not hold any data. Instead of asking every
+        # parent level in turn the value is read from the root source
+        # and the remaining keys are looked up in the raw data.
+        root = self._parent
+        while root._parent is not None:
+            root = root._parent
+
+        keychain = self._keychain[len(root._keychain):]
+        return root._get_nested(keychain + (key,))
+
+    def _get_nested(self, keychain):
+        """Proxies a nested value of the underlying data source"""
+        value = self._get_value(keychain[0])
+        for key in keychain[1:]:
+            value = value[key]
+        return value
+
+    def _get_subsection(self, key):
+        # subsections do not hold any data on their own so the same
+        # object can be returned as long as it is still in use
+        if self._subsections is None:
+            self._subsections = weakref.WeakValueDictionary()
+
+        subsection = self._subsections.get(key)
+        if subsection is None:
+            subsection = self._subsections[key] = Source(
+                parent=self,
+                keychain=self._keychain + (key,),
+                meta=self._meta,
+                **self._kwargs
+            )
+        return subsection
 
     def _set_data(self, data):
         self._check_writable()
@@ -207,16 +281,21 @@ class AbstractSource(object):
             raise TypeError('%s is a read-only source' % self._meta.source_name)
 
     def __getattr__(self, name):
+        # unset slots and the missing instance dictionary of slotted
+        # sources must not be looked up as keys
+        if name in self._slots or name == '__dict__':
+            return object.__getattribute__(self, name)
+
         try:
             return self[name]
         except KeyError:
             return object.__getattribute__(self, name)
 
     def __setattr__(self, attr, value):
-        if any([self._initialized is False,
-                attr == '_initialized',
-                attr in self.__dict__,
-                attr in self.__class__.__dict__]):
+        if (self._initialized is False
+                or attr in self._slots
+                or attr in getattr(self, '__dict__', ())
+                or attr in self.__class__.__dict__):
             super(AbstractSource, self).__setattr__(attr, value)
         else:
             self[attr] = value
@@ -241,6 +320,22 @@ class AbstractSource(object):
         """
         raise NotImplementedError
 
+    def _read_key(self, key):
+        """Provide read access to a single key of the underlying source.
+
+        This method is optional and by default reads the whole source
+        through :any:`_read` to return the requested value. Override it
+        if the underlying source can provide single values more cheaply
+        than the whole dataset.
+
+        Args:
+            key (str): The name of the requested top-level key.
+
+        Raises:
+            KeyError: The key does not exist in the underlying source.
+        """
+        return self._read()[key]
+
     def _write(self, data):
         """Provide write access to underlying source.
 
@@ -264,11 +359,22 @@ class AbstractSource(object):
 
 class LockedSourceMixin(AbstractSource):
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         self._locked = kwargs.pop('readonly', False)
 
         super(LockedSourceMixin, self).__init__(*args, **kwargs)
 
+        # the writability does not change after initialization so the
+        # reason for rejecting writes is determined once upfront
+        if self._meta.readonly:
+            self._write_error = '%s is a read-only source' % self._meta.source_name
+        elif self._locked:
+            self._write_error = '%s is locked and cannot be changed' % self._meta.source_name
+        else:
+            self._write_error = None
+
     def is_writable(self):
         """Check whether this source loader can be written to.
 
@@ -280,19 +386,22 @@ class LockedSourceMixin(AbstractSource):
         return is_writable and not self._locked
 
     def _check_writable(self):
-        super(LockedSourceMixin, self)._check_writable()
-
-        if self._locked:
-            raise TypeError('%s is locked and cannot be changed' % self._meta.source_name)
+        if self._write_error:
+            raise TypeError(self._write_error)
 
 
 class CacheMixin(AbstractSource):
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         # will be applied to top level source classes only as nested
         # sublevels which are also Source instances do not need caching.
         self._use_cache = kwargs.pop('cached', False)
         self._cache = None
+        # values that were already looked up in the cache including
+        # subsections and converted values
+        self._cached_values = {} if self._use_cache else None
 
         super(CacheMixin, self).__init__(*args, **kwargs)
 
@@ -324,22 +433,160 @@ class CacheMixin(AbstractSource):
         was set initially.
         """
         self._cache = None
+        self._cached_values = {}
 
     def _get_data(self):
-        if self._use_cache and self._cache:
-            return self._cache
+        if self._use_cache:
+            if self._cache:
+                return self._cache
+            self._cached_values = {}
 
         self._cache = super(CacheMixin, self)._get_data()
         return self._cache
 
+    def _get_value(self, key):
+        if self._use_cache:
+            return self._get_data()[key]
+        return super(CacheMixin, self)._get_value(key)
+
     def _set_data(self, data):
         self._check_writable()
 
         if self._use_cache:
             self._cache = data
+            self._cached_values = {}
         else:
             return super(CacheMixin, self)._set_data(data)
 
+    def __getitem__(self, key):
+        if not self._use_cache:
+            return super(CacheMixin, self).__getitem__(key)
+
+        # the cached data only changes through this source, so the
+        # final value can be kept until the cache changes. That saves
+        # the lookup through all other mixins on subsequent reads.
+        try:
+            return self._cached_values[key]
+        except KeyError:
+            value = super(CacheMixin, self).__getitem__(key)
+            self._cached_values[key] = value
+            return value
+
+
+class ConverterMap(object):
+    """Resolve converters for keychains and remember the results.
+
+    Finding the converter for a key requires to match the whole keychain
+    against the patterns of all converters. The result only depends on
+    the keychain though, so it is resolved once and then looked up. The
+    map is shared between a source and all of its subsections.
+
+    Args:
+        converters (list): The prioritized :any:`converters <Converter>`.
+    """
+
+    def __init__(self, converters):
+        self._converters = list(converters)
+        self._sections = {}
+
+        # combine the patterns into as few regexes as possible so that
+        # a keychain is matched in one pass no matter how many
+        # converters exist. Every pattern is prefixed with a lazy
+        # wildcard and the regex is anchored at the start. That way the
+        # alternatives are tried in order of their priority instead of
+        # the position where they match.
+        self._patterns = []
+        patterns = []
+        groups = 0
+        for index, converter in enumerate(self._converters):
+            pattern = converter.pattern
+            # python < 3.6 appends the flags to the translated pattern
+            if pattern.endswith('(?ms)'):
+                pattern = pattern[:-len('(?ms)')]
+
+            # python < 3.5 cannot compile regexes with too many groups
+            # so the patterns are split across several regexes
+            size = re.compile(pattern).groups + 1
+            if patterns and groups + size > _MAX_GROUPS:
+                self._add_patterns(patterns)
+                patterns = []
+                groups = 0
+
+            patterns.append('.*?(?P<c%d>%s)' % (index, pattern))
+            groups += size
+
+        if patterns:
+            self._add_patterns(patterns)
+
+    def section(self, keychain):
+        """Get the resolved converters of the section at keychain.
+
+        Subsections keep their section so that further lookups only
+        need the remaining key instead of the whole keychain.
+
+        Returns:
+            A :any:`ConverterSection` of the given keychain.
+        """
+        try:
+            return self._sections[keychain]
+        except KeyError:
+            section = self._sections[keychain] = ConverterSection(self, keychain)
+            return section
+
+    def match(self, keychain):
+        """Get the converter with the highest priority for a keychain.
+
+        Returns:
+            The matching converter or None if no converter fits.
+        """
+        path = '.'.join(keychain)
+
+        # the regexes are ordered by priority as well
+        for pattern in self._patterns:
+            match = pattern.match(path)
+            if match:
+                # strip the prefix from the group name to get the index
+                return self._converters[int(match.lastgroup[1:])]
+
+        return None
+
+    def __len__(self):
+        return len(self._converters)
+
+    def _add_patterns(self, patterns):
+        self._patterns.append(re.compile('|'.join(patterns), re.M | re.S))
+
+
+class ConverterSection(dict):
+    """Map the keys of a section to their converters.
+
+    Converters of unknown keys will be resolved through the
+    :any:`ConverterMap` on first access.
+    """
+
+    def __init__(self, converter_map, keychain):
+        super(ConverterSection, self).__init__()
+        self._converter_map = converter_map
+        self._keychain = keychain
+        self._subsections = {}
+
+    def subsection(self, key):
+        """Get the section of a direct child key.
+
+        The child sections are remembered by key so that neither the
+        keychain tuple needs to be built nor hashed again.
+        """
+        try:
+            return self._subsections[key]
+        except KeyError:
+            section = self._subsections[key] = self._converter_map.section(
+                self._keychain + (key,))
+            return section
+
+    def __missing__(self, key):
+        converter = self[key] = self._converter_map.match(self._keychain + (key,))
+        return converter
+
 
 class ConverterMixin(AbstractSource):
     """Provide a list of prioritized value converters.
@@ -351,14 +598,28 @@ class ConverterMixin(AbstractSource):
     function.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         # will be applied to child classes as sublevel sources
         # do not need caching.
-        self._converters = [self._make_converter(spec)
-                            for spec in kwargs.get('converters', [])]
+        converter_map = kwargs.get('converters', [])
+        if not isinstance(converter_map, ConverterMap):
+            converter_map = ConverterMap([self._make_converter(spec)
+                                          for spec in converter_map])
+
+        # pass the map on to subsections so that they share the
+        # already resolved converters
+        self._converters = kwargs['converters'] = converter_map
 
         super(ConverterMixin, self).__init__(*args, **kwargs)
 
+        # the keychain is only known after initialization. Afterwards
+        # it is replaced by the one of the section so that all objects
+        # of the same section share a single keychain tuple.
+        self._converter_section = converter_map.section(self._keychain)
+        self._keychain = self._converter_section._keychain
+
     def dump(self):
         """Read and dump data from underlying source.
 
@@ -369,17 +630,119 @@ class ConverterMixin(AbstractSource):
             The dumped data will be a default python :any:`dictionary <dict>`.
         """
         dumped = super(ConverterMixin, self).dump()
+        result = {}
 
-        def convert_dict(data):
-            for key, value in data.items():
-                typed = self[key]
+        # walk the dumped data directly instead of creating a source
+        # object for every subsection on the way
+        sections = [((), self._converter_section, dumped, result)]
 
-                if isinstance(typed, Source):
-                    yield key, typed.dump()
+        while sections:
+            keys, section, data, target = sections.pop()
+
+            for key, value in data.items():
+                if section[key]:
+                    # converters receive subsections as source objects
+                    # so the value has to be accessed the regular way
+                    value = functools.reduce(operator.getitem,
+                                             keys + (key,), self)
+                    if isinstance(value, Source):
+                        value = value.dump()
+                    target[key] = value
+                elif isinstance(value, dict):
+                    target[key] = {}
+                    sections.append((keys + (key,), section.subsection(key),
+                                     value, target[key]))
                 else:
-                    yield key, typed
+                    target[key] = value
 
-        return dict(convert_dict(dumped))
+        return result
+
+    def make_getter(self, *keys):
+        """Create a getter for a nested value.
+
+        Accessing nested values with dot-notation creates a subsection
+        object on every level. The returned getter reads the value from
+        the underlying data directly instead, which makes it a good fit
+        for values that are read repeatedly.
+
+        Args:
+            keys (str): One or more keys that lead to the value.
+
+        Returns:
+            A function without arguments that returns the current value.
+
+        Raises:
+            TypeError: If no keys were given.
+
+        Example:
+            >>> config = DictSource({'a': {'b': {'c': 1}}})
+            >>> get_c = config.make_getter('a', 'b', 'c')
+            >>> get_c()
+            1
+        """
+        if not keys:
+            raise TypeError('make_getter() requires at least one key')
+
+        def traverse():
+            return functools.reduce(operator.getitem, keys, self)
+
+        # converters of intermediate keys might turn a whole section
+        # into a custom object, so those paths must be traversed
+        section = self._converter_section
+        for key in keys[:-1]:
+            if section[key]:
+                return traverse
+            section = section.subsection(key)
+
+        converter = section[keys[-1]]
+
+        # subsections do not hold any data so the value is read from the
+        # root source which only copies the final value
+        root = self
+        while root._parent is not None:
+            root = root._parent
+        keychain = self._keychain[len(root._keychain):] + keys
+
+        def getter():
+            try:
+                value = root._get_nested(keychain)
+            except (KeyError, TypeError):
+                # let the regular access handle missing subsections
+                # and raise the usual errors
+                return traverse()
+
+            # sections are returned as source objects
+            if isinstance(value, dict):
+                return traverse()
+
+            return converter.customize(value) if converter else value
+
+        return getter
+
+    def values(self):
+        """Same as :any:`dict.values`."""
+        for key, value in self.items():
+            yield value
+
+    def items(self):
+        """Same as :any:`dict.items`."""
+        # read the data only once instead of once per key and take the
+        # converters from the already resolved section
+        data = self._get_data()
+        section = self._converter_section
+
+        for key in sorted(data):
+            value = data[key]
+            if isinstance(value, dict):
+                value = self._get_subsection(key)
+
+            converter = section[key]
+            yield key, converter.customize(value) if converter else value
+
+    def update(self, arg, **kwargs):
+        """Same as :any:`dict.update`."""
+        values = self._reset_values(arg, kwargs)
+        super(ConverterMixin, self).update(values)
 
     def _customize(self, key, value):
         converter = self._get_converter(key)
@@ -389,6 +752,16 @@ class ConverterMixin(AbstractSource):
         converter = self._get_converter(key)
         return converter.reset(value) if converter else value
 
+    def _reset_values(self, arg, kwargs):
+        # merge all values at once and only reset those values one by
+        # one that actually have a converter
+        values = dict(arg, **kwargs)
+        for key, value in values.items():
+            converter = self._get_converter(key)
+            if converter:
+                values[key] = converter.reset(value)
+        return values
+
     def _make_converter(self, converter_spec):
         if isinstance(converter_spec, converters.Converter):
             return converter_spec
@@ -396,10 +769,7 @@ class ConverterMixin(AbstractSource):
             return converters.Converter(*converter_spec)
 
     def _get_converter(self, key):
-        search_key = '.'.join(self._keychain + (key,))
-        for converter in self._converters:
-            if re.search(converter.pattern, search_key):
-                return converter
+        return self._converter_section[key]
 
     def __getitem__(self, key):
         attr = super(ConverterMixin, self).__getitem__(key)
@@ -412,6 +782,8 @@ class ConverterMixin(AbstractSource):
 
 class DefaultValueMixin(AbstractSource):
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         self._add_subsection = kwargs.get('auto_subsection', False)
 
@@ -465,3 +837,5 @@ class Source(CacheMixin,
         KeyError: You tried to access a key that does not exist.
         TypeError: You tried to write to a source which is read-only.
     """
+
+    __slots__ = ()
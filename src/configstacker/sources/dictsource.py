@@ -2,6 +2,8 @@
 
 import copy
 
+import six
+
 from . import base
 
 __all__ = ['DictSource']
@@ -37,14 +39,83 @@ class DictSource(base.Source):
         True
     """
 
+    __slots__ = ('_data', '_owns_data', '_direct_reads', '_direct_writes')
+
     def __init__(self, data=None, **kwargs):
         super(DictSource, self).__init__(**kwargs)
         self._data = data or {}
+        self._owns_data = False
+        self._direct_reads = _inherits(self, '_read')
+        self._direct_writes = self._direct_reads and _inherits(self, '_write')
 
     def _read(self):
         # use deepcopy to prevent uncontrolled changes
         # to self._data from outside of this class
         return copy.deepcopy(self._data)
 
+    def _read_key(self, key):
+        if not self._direct_reads:
+            return super(DictSource, self)._read_key(key)
+
+        # only copy the requested value instead of the whole dataset
+        return copy.deepcopy(self._data[key])
+
+    def _get_nested(self, keychain):
+        if self._use_cache or not self._direct_reads:
+            return super(DictSource, self)._get_nested(keychain)
+
+        # walk the data directly so that only the requested value is
+        # copied instead of the whole top-level section
+        value = self._data
+        for key in keychain:
+            value = value[key]
+        return copy.deepcopy(value)
+
     def _write(self, data):
         self._data = data
+        self._owns_data = True
+
+    def _get_own_data(self):
+        # the given dictionary belongs to the caller and must not be
+        # changed. It is copied once before the first in-place change.
+        if not self._owns_data:
+            self._data = dict(self._data)
+            self._owns_data = True
+        return self._data
+
+    def __setitem__(self, key, value):
+        # cached writes need to go through the cache as do writes of
+        # subclasses that read or write the data on their own
+        if self._use_cache or not self._direct_writes:
+            return super(DictSource, self).__setitem__(key, value)
+
+        # the data is kept in memory anyway so it can be changed in
+        # place instead of copying and writing it back as a whole.
+        self._check_writable()
+        self._get_own_data()[key] = self._reset(key, value)
+
+    def update(self, arg, **kwargs):
+        if self._use_cache or not self._direct_writes:
+            return super(DictSource, self).update(arg, **kwargs)
+
+        self._check_writable()
+        self._get_own_data().update(self._reset_values(arg, kwargs))
+
+    def __contains__(self, key):
+        if self._use_cache or not self._direct_reads:
+            return super(DictSource, self).__contains__(key)
+        return key in self._data
+
+    def __delitem__(self, key):
+        if self._use_cache or not self._direct_writes:
+            return super(DictSource, self).__delitem__(key)
+
+        self._check_writable()
+        del self._get_own_data()[key]
+
+
+def _inherits(source, name):
+    # subclasses may change how the data is read or written. The data
+    # can only be accessed directly if they kept the implementation.
+    method = six.get_unbound_function(getattr(type(source), name))
+    return method is six.get_unbound_function(getattr(DictSource, name))
@@ -62,15 +62,22 @@ class Environment(base.Source):
         self.subsection_token = subsection_token
 
     def _read(self):
+        return self._parse()
+
+    def _read_key(self, key):
+        # only the variables of the requested key need to be parsed
+        return self._parse(key)[key]
+
+    def _parse(self, only_key=None):
         data = {}
         for keys, value in self._iter_environ():
-            keychain = keys.lower().split(self.subsection_token)
+            keychain = keys.split(self.subsection_token)
 
             # do not remove prefix when it is an empty string
             # which is only used for accessing system environment
             # variables.
             if self._prefix:
-                keychain.pop(0)
+                del keychain[0]
 
             # either the subsection token was changed or the prefix was
             # found in the environment variables without any key name
@@ -79,6 +86,12 @@ class Environment(base.Source):
             if not keychain:
                 continue
 
+            if only_key is not None and keychain[0] != only_key:
+                continue
+
+            # interned keys allow faster lookups in the resulting dict
+            keychain = [six.moves.intern(key) for key in keychain]
+
             # separate last key which is a leaf
             key = keychain.pop()
 
@@ -88,19 +101,27 @@ class Environment(base.Source):
         return data
 
     def _write(self, data):
-        def _write(section, keychain):
+        # walk the sections iteratively to prevent deep recursions. The
+        # variable name is built up along the way instead of joining
+        # the whole keychain again for every single value.
+        sections = [(data, self._prefix)]
+
+        while sections:
+            section, section_name = sections.pop()
+
             for key, value in six.iteritems(section):
-                next_keychain = keychain + [key]
+                full_key = section_name + self.subsection_token + key
                 if isinstance(value, dict):
-                    _write(value, next_keychain)
+                    sections.append((value, full_key))
                 else:
-                    full_key = self.subsection_token.join(next_keychain)
                     os.environ[full_key.upper()] = str(value)
 
-        _write(data, [self._prefix])
-
     def _iter_environ(self):
+        # keys are returned in lower case so that every key only needs
+        # to be converted once. An empty prefix matches all variables
+        # and does not need to be checked at all.
         prefix_ = self._prefix.lower()
         for key, value in six.iteritems(os.environ):
-            if key.lower().startswith(prefix_):
+            key = key.lower()
+            if not prefix_ or key.startswith(prefix_):
                 yield key, value
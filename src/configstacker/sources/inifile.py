@@ -2,6 +2,8 @@
 
 from collections import deque
 
+import six
+
 from .. import utils
 from . import base
 
@@ -55,19 +57,37 @@ class INIFile(base.Source):
         self.subsection_token = subsection_token
         self.root_section = root_section
         self._parser = _parse_source(source)
+        self._data = None
 
     def _read(self):
+        return _copy_sections(self._get_sections())
+
+    def _read_key(self, key):
+        value = self._get_sections()[key]
+        return _copy_sections(value) if isinstance(value, dict) else value
+
+    def _get_sections(self):
+        # the parser only changes when writing to it, so the resulting
+        # dictionary is kept until then. Values are always strings
+        # which allows to only copy the sections when reading.
+        if self._data is None:
+            self._data = self._build_sections()
+        return self._data
+
+    def _build_sections(self):
         data = {}
         for section in self._parser.sections():
             if section == self.root_section:
                 subsections = []
-            elif self.subsection_token and self.subsection_token in section:
+            elif self.subsection_token:
+                # sections without the token result in a single element
                 subsections = section.split(self.subsection_token)
             else:
                 subsections = [section]
 
-            items = self._parser.items(section)
-            subdict = utils.make_subdicts(data, subsections)
+            items = [(_intern(key), value)
+                     for key, value in self._parser.items(section)]
+            subdict = utils.make_subdicts(data, map(_intern, subsections))
             subdict.update(items)
 
         return data
@@ -102,6 +122,10 @@ class INIFile(base.Source):
             for key, value in items:
                 self._parser.set(section, key, str(value))
 
+        # the parser was changed so the sections have to be built again
+        # even if writing the file fails
+        self._data = None
+
         with open(self._source, 'w') as fh:
             self._parser.write(fh)
 
@@ -116,3 +140,13 @@ def _parse_source(source):
         parser._read(source, source)
 
     return parser
+
+
+def _copy_sections(data):
+    return dict((key, _copy_sections(value) if isinstance(value, dict) else value)
+                for key, value in data.items())
+
+
+def _intern(key):
+    # unicode strings cannot be interned on python 2
+    return six.moves.intern(key) if isinstance(key, str) else key
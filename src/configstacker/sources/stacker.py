@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 
-import distutils
+import functools
+import heapq
+import operator
 import sys
+import weakref
 from collections import deque
 
-from .. import strategies
+from .. import converters, strategies
 from . import base, dictsource
 
 try:
@@ -16,6 +19,9 @@ __all__ = ['StackedConfig']
 
 PY35 = sys.version_info[0:2] >= (3, 5)
 
+# source types that already passed the validation of a source list
+_valid_types = set()
+
 
 class SourceList(MutableSequence):
     """Prioritized container for source handlers.
@@ -36,14 +42,22 @@ class SourceList(MutableSequence):
             traversed in reverse. By default this will be False.
     """
 
-    def __init__(self, *sources, **kwargs):
-        self._validate_sources(sources)
-        self._sources = list(sources)
+    __slots__ = (
+        '_keychain', '_sources', '_version', '_reversed', '_sublevels',
+        '_typed_flags', '_writable_flags', '_writable',
+    )
 
+    def __init__(self, *sources, **kwargs):
         # _keychain is a list of keys that leads from the root
         # config to the subconfig
         self._keychain = kwargs.pop('keychain', ())
 
+        for source in sources:
+            self._validate_source(source)
+        self._sources = list(sources)
+        self._version = 0
+        self._refresh()
+
         # convenience functionality that allows to specify
         # the priority for traversing the sources
         if kwargs.pop('reverse', False):
@@ -65,46 +79,86 @@ class SourceList(MutableSequence):
                 :any:`configstacker.Source` instance.
         """
         self._check_mutability()
-        self._validate_sources([source])
+        self._validate_source(source)
         self._sources.insert(index, source)
+        self._refresh()
+
+    def find(self, key):
+        """Iterate over all sources that contain key.
+
+        The sources are searched lazily so that the search stops as
+        soon as the caller does not need any more sources.
+        """
+        for source in self._iter_sources():
+            if key in source:
+                yield source
 
     def typed(self):
         """Iterate over all typed sources."""
-        def filter_by_type(source):
-            return source.is_typed()
-
-        for source in self._iter_sources(filter_by_type):
-            yield source
+        return self._iter_sources(self._typed_flags)
 
     def writable(self):
         """Iterate over all writable sources."""
-        def filter_by_writability(source):
-            return source.is_writable()
-
-        for source in self._iter_sources(filter_by_writability):
-            yield source
-
-    def _iter_sources(self, filter_fn=None):
-        if not filter_fn:
-            def filter_fn(s):
-                return True
+        return self._iter_sources(self._writable_flags)
+
+    def _iter_sources(self, flags=None):
+        # the sublevels of the sources are only resolved once. They do
+        # not hold any data themselves and will stay valid.
+        if self._sublevels is None:
+            self._sublevels = tuple(self._traverse(source)
+                                    for source in self._reversed)
+
+        if flags is None:
+            return iter(self._sublevels)
+
+        return (sublevel for sublevel, flag in zip(self._sublevels, flags)
+                if flag)
+
+    def _traverse(self, source):
+        # return the sublevel of the source according to the keychain
+        for key in self._keychain:
+            source = source[key]
+        return source
+
+    def _first_writable(self):
+        if self._writable is None:
+            return None
+        return self._traverse(self._writable)
+
+    def _refresh(self):
+        # the priority order and the writability of the sources only
+        # change when the list of sources is changed. Therefore they
+        # are determined here once instead of on every iteration.
+        self._version += 1
+        self._reversed = tuple(reversed(self._sources))
+        self._sublevels = None
+
+        # the flags are checked on the root sources as subsections do
+        # not inherit the readonly flag
+        self._typed_flags = tuple(source.is_typed()
+                                  for source in self._reversed)
+        self._writable_flags = tuple(source.is_writable()
+                                     for source in self._reversed)
+
+        self._writable = None
+        for source, writable in zip(self._reversed, self._writable_flags):
+            if writable:
+                self._writable = source
+                break
+
+    def _validate_source(self, source):
+        # most sources share a few types so a type that was valid once
+        # does not need to be checked again
+        source_type = type(source)
+        if source_type in _valid_types:
+            return
 
-        # return the sublevels of the sources according to the
-        # keychain
-        for source in reversed(self._sources):
-            if filter_fn(source) is False:
-                continue
-            traversed_source = source
-            for key in self._keychain:
-                traversed_source = traversed_source[key]
-            yield traversed_source
+        if not isinstance(source, base.Source):
+            msg = ("A source must be a subclass of"
+                   " 'configstacker.sources.Source' not '%s'")
+            raise ValueError(msg % source.__class__.__name__)
 
-    def _validate_sources(self, sources):
-        for source in sources:
-            if not isinstance(source, base.Source):
-                msg = ("A source must be a subclass of"
-                       " 'configstacker.sources.Source' not '%s'")
-                raise ValueError(msg % source.__class__.__name__)
+        _valid_types.add(source_type)
 
     def __len__(self):
         return len(self._sources)
@@ -114,13 +168,15 @@ class SourceList(MutableSequence):
 
     def __setitem__(self, index, value):
         self._check_mutability()
-        self._validate_sources([value])
+        self._validate_source(value)
         self._sources[index] = value
+        self._refresh()
 
     def __delitem__(self, item):
         if not PY35:
             item -= 1
         del self._sources[item]
+        self._refresh()
 
     def __iter__(self):
         return self._iter_sources()
@@ -158,6 +214,13 @@ class StackedConfig(base.Source):
             object creation through
             :any:`self.source_list.reverse() <SourceList.reverse>`.
 
+        cached (bool): Remember merged values so that repeated reads
+            do not search all sources again. Writes through the
+            configuration and changes to the source list are detected
+            automatically. After changing sources directly or replacing
+            or changing the :attr:`strategy_map` you have to call
+            :any:`clear_cache`. Defaults to False.
+
     Attributes:
         strategy_map: The strategy map is a dictionary where the
             keys are the name of values you want to handle and the
@@ -189,6 +252,12 @@ class StackedConfig(base.Source):
             holds all source loaders that will be used by StackedConfig.
     """
 
+    # subconfigs are created for every accessed section
+    __slots__ = (
+        'source_list', 'strategy_map', '_root', '_changes',
+        '_cached_version', '_subconfigs',
+    )
+
     def __init__(self, *sources, **kwargs):
         super(StackedConfig, self).__init__(**kwargs)
 
@@ -211,19 +280,30 @@ class StackedConfig(base.Source):
         # values of the same key
         self.strategy_map = kwargs.pop('strategy_map', {})
 
+        # cached values of the root config and all of its subconfigs
+        # are valid as long as nothing was written and the sources
+        # stayed the same
+        self._root = self.get_root()
+        self._changes = 0
+        self._cached_version = None
+
+        # subconfigs that are still in use by key
+        self._subconfigs = weakref.WeakValueDictionary()
+
     # public api
     # ==========
     def is_writable(self):
-        for source in self.source_list.writable():
-            return True
-        return False
+        # the source list already knows its first writable source
+        return self.source_list._writable is not None
 
     def is_typed(self):
-        for source in self.source_list.typed():
-            return True
-        return False
+        return any(self.source_list._typed_flags)
 
     def dump(self):
+        merged = self._merge_dumps()
+        if merged is not None:
+            return merged
+
         def _dump(obj):
             for key, value in obj.items():
                 if isinstance(value, StackedConfig):
@@ -233,35 +313,178 @@ class StackedConfig(base.Source):
 
         return dict(_dump(self))
 
+    def freeze(self):
+        """Create a read-only snapshot of the stacked configuration.
+
+        Every access on a StackedConfig searches all sources, converts
+        untyped values and applies strategies. For read-heavy code paths
+        where the configuration does not change anymore this work can
+        be done once upfront. The snapshot will not reflect later
+        changes to the underlying sources.
+
+        Returns:
+            A read-only :any:`DictSource` containing the merged and
+            converted values.
+
+        Example:
+            >>> config = StackedConfig(DictSource({'a': 1}),
+            ...                        DictSource({'b': {'c': 2}}))
+            >>> frozen = config.freeze()
+            >>> frozen
+            DictSource({'a': 1, 'b': {'c': 2}})
+            >>> frozen.is_writable()
+            False
+        """
+        return dictsource.DictSource(self.dump(), readonly=True)
+
+    def clear_cache(self):
+        """Forget all remembered values.
+
+        This affects the whole configuration including all subconfigs
+        and is only required when ``cached=True`` was set and sources
+        or the strategy map were changed directly.
+        """
+        self._root._changes += 1
+
+    def make_getter(self, *keys):
+        if not keys:
+            raise TypeError('make_getter() requires at least one key')
+
+        # values of stacked configurations need to be searched in all
+        # sources, so there is no shortcut to the underlying data
+        def getter():
+            return functools.reduce(operator.getitem, keys, self)
+        return getter
+
     # dict api
     # ========
     def keys(self):
         def key_iterator():
-            yielded_keys = set()
-
-            for source in self.source_list:
-                for key in source:
-                    if key not in yielded_keys:
-                        yield key
-                        yielded_keys.add(key)
+            # merging the sorted keys of every source results in sorted
+            # keys where duplicates are adjacent to each other. Sources
+            # mostly return their keys sorted already which makes
+            # sorting them again cheap.
+            merged = heapq.merge(*[sorted(source.keys())
+                                   for source in self.source_list])
+            previous = strategies.EMPTY
+
+            for key in merged:
+                if key != previous:
+                    yield key
+                    previous = key
+
+        return list(key_iterator())
+
+    def values(self):
+        for key, value in self.items():
+            yield value
+
+    def items(self):
+        merged = self._merge_dumps()
+
+        # values need to be searched in all sources
+        if merged is None:
+            for key in self.keys():
+                yield key, self[key]
+            return
 
-        return sorted(key_iterator())
+        for key in sorted(merged):
+            value = merged[key]
+            # sections are returned as subconfigs
+            if isinstance(value, dict):
+                value = self[key]
+            yield key, value
 
     def update(self, arg, **kwargs):
-        for other in (arg, kwargs):
-            for key, value in dict(other).items():
-                self[key] = value
+        # group the values by the source they will be written to so that
+        # every source is only written once
+        batches = {}
+        for key, value in dict(arg, **kwargs).items():
+            source = next(self.source_list.find(key), None)
+            if source is None:
+                source = self.source_list._first_writable()
+                if source is None:
+                    raise TypeError('No writable sources found')
+            batches.setdefault(id(source), (source, {}))[1][key] = value
+
+        self._root._changes += 1
+
+        for source, values in batches.values():
+            source.update(values)
 
     def __getitem__(self, key):
+        if not self._use_cache:
+            return self._get_merged_value(key)
+
+        version = (self._root._changes, self._root.source_list._version)
+        if version != self._cached_version:
+            self._cached_values = {}
+            self._cached_version = version
+
+        try:
+            return self._cached_values[key]
+        except KeyError:
+            value = self._cached_values[key] = self._get_merged_value(key)
+            return value
+
+    def __setitem__(self, key, value):
+        self._root._changes += 1
+
+        for source in self.source_list.find(key):
+            source[key] = value
+            return
+
+        # no source was found so write it to first writable source
+        source = self.source_list._first_writable()
+        if source is None:
+            raise TypeError('No writable sources found')
+
+        source[key] = value
+
+    def __contains__(self, key):
+        # stop at the first source that contains the key instead of
+        # collecting the keys of all sources
+        for source in self.source_list.find(key):
+            return True
+        return False
+
+    def __eq__(self, other):
+        return self.dump() == other.dump()
+
+    def __len__(self):
+        return len(self._collect_keys())
+
+    def __iter__(self):
+        return iter(self._collect_keys())
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, repr(self.dump()))
+
+    # internal api
+    # ============
+    def _read(self):
+        # not yet used due to refactorings. Probably we can move actual
+        # traversing here. However that might conflict with the initial
+        # intention to load the whole dictionary. Having lots of sources
+        # might then be problematic.
+        pass
+
+    def _get_merged_value(self, key):
+        # keys without a strategy are decided by the first source that
+        # contains them. Both cases are handled separately so that the
+        # search loops do not need to check for a strategy every time.
+        strategy = self.strategy_map.get(key)
+        if strategy:
+            return self._get_reduced_value(key, strategy)
+        return self._get_shadowing_value(key)
+
+    def _get_shadowing_value(self, key):
         # will be used as input for a new sublevel config with the
         # key added to the keychain.
         subsections = deque()
 
         converter = self._get_converter(key)
 
-        strategy = self.strategy_map.get(key)
-        result = strategies.EMPTY
-
         for source in self.source_list:
             try:
                 value = source[key]
@@ -275,88 +498,86 @@ class StackedConfig(base.Source):
                 # .. convert the whole section when the user asked
                 # for it specifically.
                 if converter:
-                    value = converter.customize(value)
+                    return converter.customize(value)
 
                 # .. or otherwise add it to the subsections so that we
                 # can gather all of them from all sources and put them
                 # together into a new subconfig afterwards.
-                else:
-                    subsections.appendleft(source.get_root())
-                    continue
+                subsections.appendleft(source.get_root())
 
-            # the key was found and holds a normal value instead.
-            else:
-                if not source.is_typed():
-                    value = self._get_typed_value(key, value)
+            # the key was found and holds a normal value instead which
+            # is shadowed by the subsections of sources with a higher
+            # priority so there is nothing left to search for.
+            elif subsections:
+                break
 
-                if converter:
-                    value = converter.customize(value)
-
-            # the key was either a normal value or a subsection that was
-            # converted to a custom object. In both cases we still apply
-            # a strategy if the user set one. If the user did specify
-            # one this also means we will continue looking for the key
-            # in other sources, too. Therefore we are not returning the
-            # value just yet.
-            if strategy:
-                result = strategy(result, value)
+            # .. or otherwise shadows all sources with a lower priority.
             else:
-                return value
+                return self._convert_value(source, key, value, converter)
 
         # we exited the for-loop without returning a value because..
-        # .. the user specified a strategy so that we had to iterate
-        # all sources.
-        if strategy:
-            return result
-        # .. or the key held a subsection and we have to convert them to
+        # .. the key held a subsection and we have to convert them to
         # a subconfig.
-        elif subsections:
+        if subsections:
             return self._make_subconfig(subsections, key)
         # .. or the key really wasn't found at all.
         else:
             raise KeyError("Key '%s' was not found" % key)
 
-    def __setitem__(self, key, value):
-        for source in self.source_list:
-            if key in source:
-                source[key] = value
-                return
-
-        # no source was found so write it to first writable source
-        for source in self.source_list.writable():
-            source[key] = value
-            return
+    def _get_reduced_value(self, key, strategy):
+        converter = self._get_converter(key)
+        values = []
 
-        raise TypeError('No writable sources found')
+        for source in self.source_list:
+            try:
+                value = source[key]
+            except KeyError:
+                continue
 
-    def __eq__(self, other):
-        return self.dump() == other.dump()
+            # subsections can only be merged by a strategy when they
+            # are converted to custom objects.
+            if isinstance(value, base.Source):
+                if not converter:
+                    continue
+                value = converter.customize(value)
+            else:
+                value = self._convert_value(source, key, value, converter)
 
-    def __len__(self):
-        return len(list(iter(self)))
+            # the user specified a strategy so we have to iterate all
+            # sources instead of returning the first value.
+            values.append(value)
 
-    def __iter__(self):
-        yielded = set()
+        return strategies.reduce_values(strategy, values)
 
-        for source in self.source_list:
-            for key in source:
-                if key in yielded:
-                    continue
+    def _convert_value(self, source, key, value, converter):
+        if not source.is_typed():
+            value = self._get_typed_value(key, value)
 
-                yielded.add(key)
-                yield key
+        if converter:
+            value = converter.customize(value)
 
-    def __repr__(self):
-        return '%s(%s)' % (self.__class__.__name__, repr(self.dump()))
+        return value
 
-    # internal api
-    # ============
-    def _read(self):
-        # not yet used due to refactorings. Probably we can move actual
-        # traversing here. However that might conflict with the initial
-        # intention to load the whole dictionary. Having lots of sources
-        # might then be problematic.
-        pass
+    def _merge_dumps(self):
+        # without strategies, converters and untyped values the dumps
+        # of all sources only need to be merged in order of priority.
+        # Otherwise None is returned and every key has to be looked up.
+        if (self.strategy_map or self._converters
+                or not all(self.source_list._typed_flags)):
+            return None
+
+        merged = {}
+        for source in reversed(tuple(self.source_list)):
+            _merge_dicts(merged, source.dump())
+        return merged
+
+    def _collect_keys(self):
+        # let dict.update deduplicate the keys of all sources instead
+        # of checking every single key against the already found ones
+        keys = {}
+        for source in self.source_list:
+            keys.update(dict.fromkeys(source))
+        return keys
 
     def _get_typed_value(self, key, value):
         for source in self.source_list.typed():
@@ -370,30 +591,62 @@ class StackedConfig(base.Source):
         return value
 
     def _make_subconfig(self, sources, key):
-        return StackedConfig(*sources,
-                             parent=self,
-                             keychain=self._keychain + (key,),
-                             strategy_map=self.strategy_map,
-                             converters=self._converters
-                             )
+        # the subconfig can be reused as long as the subsection is still
+        # found in exactly the same sources and the settings which are
+        # passed down did not change in the meantime
+        subconfig = self._subconfigs.get(key)
+        if (subconfig is not None
+                and subconfig.strategy_map is self.strategy_map
+                and subconfig._converters is self._converters
+                and subconfig._use_cache == self._use_cache):
+            known_sources = subconfig.source_list._sources
+            if (len(known_sources) == len(sources)
+                    and all(known is source
+                            for known, source in zip(known_sources, sources))):
+                return subconfig
+
+        subconfig = StackedConfig(
+            *sources,
+            parent=self,
+            keychain=self._converter_section.subsection(key)._keychain,
+            strategy_map=self.strategy_map,
+            converters=self._converters,
+            cached=self._use_cache
+        )
+        self._subconfigs[key] = subconfig
+        return subconfig
+
+
+def _merge_dicts(target, data):
+    """Recursively merge data into target"""
+    for key, value in data.items():
+        existing = target.get(key)
+        if isinstance(existing, dict) and isinstance(value, dict):
+            _merge_dicts(existing, value)
+        else:
+            target[key] = value
 
 
 def _convert_value_to_type(value, type_info):
     """Convert value by dispatching from type_info"""
+    return _TYPE_CONVERTERS.get(type_info, type_info)(value)
 
-    if type_info is list:
-        return [token.strip() for token in value.split(',')]
 
-    elif type_info is tuple:
-        return tuple(token.strip() for token in value.split(','))
+def _split_tokens(value):
+    return [token.strip() for token in value.split(',')]
 
-    elif type_info is set:
-        return set([token.strip() for token in value.split(',')])
 
-    elif type_info is bool:
-        try:
-            return bool(distutils.util.strtobool(value))
-        except ValueError:
-            return value
-    else:
-        return type_info(value)
+def _to_bool(value):
+    try:
+        return converters.parse_bool(value)
+    except ValueError:
+        return value
+
+
+# types that cannot be created from their string representation
+_TYPE_CONVERTERS = {
+    list: _split_tokens,
+    tuple: lambda value: tuple(_split_tokens(value)),
+    set: lambda value: set(_split_tokens(value)),
+    bool: _to_bool,
+}
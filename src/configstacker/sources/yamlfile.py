@@ -1,9 +1,22 @@
 # -*- coding: utf-8 -*-
 
+import copy
+import os
+
 try:
     import yaml
 except ImportError:
     pass
+else:
+    # prefer the much faster libyaml bindings if pyyaml was built
+    # with them. The loader is the safe one as used by yaml.safe_load
+    # whereas the dumper matches the default one of yaml.dump.
+    try:
+        from yaml import CDumper as YAMLDumper
+        from yaml import CSafeLoader as YAMLLoader
+    except ImportError:
+        from yaml import Dumper as YAMLDumper
+        from yaml import SafeLoader as YAMLLoader
 
 from . import base
 
@@ -40,11 +53,35 @@ class YAMLFile(base.Source):
 
         super(YAMLFile, self).__init__(**kwargs)
         self._source = source
+        self._file_state = None
+        self._parsed = None
 
     def _read(self):
-        with open(self._source) as fh:
-            return yaml.safe_load(fh)
+        # parsing yaml is expensive so the result is kept until the
+        # state of the file changes.
+        file_state = _get_file_state(self._source)
+
+        if file_state != self._file_state:
+            with open(self._source) as fh:
+                self._parsed = yaml.load(fh, Loader=YAMLLoader)
+            self._file_state = file_state
+
+        # use deepcopy to prevent changes to the parsed data as the
+        # caller is allowed to modify the returned dictionary
+        return copy.deepcopy(self._parsed)
 
     def _write(self, data):
         with open(self._source, 'w') as fh:
-            yaml.dump(data, fh)
+            yaml.dump(data, fh, Dumper=YAMLDumper)
+        self._file_state = None
+
+
+def _get_file_state(path):
+    # timestamps might be too coarse to notice quick rewrites of the
+    # same size so the change time and inode are compared as well.
+    # Nanoseconds are not available on python 2.
+    stat = os.stat(path)
+    return (getattr(stat, 'st_mtime_ns', stat.st_mtime),
+            getattr(stat, 'st_ctime_ns', stat.st_ctime),
+            stat.st_size,
+            stat.st_ino)
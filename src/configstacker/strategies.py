@@ -16,7 +16,9 @@ Attributes:
         :obj:`None` as a flow control value.
 """
 
-__all__ = ['add', 'collect', 'merge', 'make_join', 'EMPTY']
+import functools
+
+__all__ = ['add', 'collect', 'merge', 'make_join', 'reduce_values', 'EMPTY']
 
 
 class _Empty(object):
@@ -117,4 +119,50 @@ def make_join(separator=''):
         if previous is EMPTY:
             return next_
         return separator.join([previous, next_])
+
+    # allows reduce_values to join all values at once
+    join._separator = separator
     return join
+
+
+def reduce_values(strategy, values):
+    """Apply a strategy to all values of the same key.
+
+    This has the same result as calling the strategy for every value in
+    turn. The builtin strategies are handled in a single pass though
+    instead of calling the strategy for every single value.
+
+    Args:
+        strategy: The strategy that shall be applied.
+        values: The values from all sources in the order they were found.
+
+    Returns:
+        The result of the strategy or :obj:`EMPTY` if there are no values.
+
+    Examples:
+        >>> reduce_values(add, [1, 2, 3])
+        6
+        >>> reduce_values(make_join('-'), ['a', 'b'])
+        'a-b'
+    """
+    values = list(values)
+    if not values:
+        return EMPTY
+
+    if strategy is collect:
+        return values
+
+    if strategy is add or strategy is merge:
+        result = values[0]
+        for value in values[1:]:
+            result = result + value
+        return result
+
+    separator = getattr(strategy, '_separator', None)
+    if separator is not None:
+        # like the strategy itself a single value is returned unchanged
+        if len(values) == 1:
+            return values[0]
+        return separator.join(values)
+
+    return functools.reduce(strategy, values, EMPTY)
@@ -67,3 +67,16 @@ def inspector(fn):
     wrapper.args = None
     wrapper.kwargs = None
     return wrapper
+
+
+@pytest.helpers.register
+def setenv(monkeypatch, **variables):
+    """Sets several environment variables at once
+
+    Args:
+        monkeypatch: The monkeypatch fixture of the calling test.
+        variables: The names and values of the variables. Values
+            will be converted to strings.
+    """
+    for name, value in variables.items():
+        monkeypatch.setenv(name, str(value))
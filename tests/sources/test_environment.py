@@ -16,6 +16,20 @@ def test_read_environment_source(monkeypatch):
     assert config.b.d == {'e': '3'}
 
 
+def test_read_environment_keys_with_common_prefix(monkeypatch):
+    monkeypatch.setenv('MVP_A', '1')
+    monkeypatch.setenv('MVP_AB', '2')
+    monkeypatch.setenv('MVP_AC_D', '3')
+    config = Environment(prefix='MVP')
+
+    assert config.a == '1'
+    assert config.ab == '2'
+    assert config.ac.d == '3'
+
+    with pytest.raises(KeyError):
+        config['b']
+
+
 def test_read_environment_source_with_empty_prefix(monkeypatch):
     monkeypatch.setenv('MVP_A', '1')
     monkeypatch.setenv('MVP_B_C', '2')
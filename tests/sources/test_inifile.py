@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import io
+
 import pytest
 
 from configstacker import INIFile
@@ -44,6 +46,17 @@ def test_read_ini_source_from_file_object(ini_file):
     assert config['b/d/f'].g == '4'
 
 
+def test_keep_written_values_of_file_objects():
+    config = INIFile(io.StringIO(u"[__root__]\na=1\n"))
+    assert config.a == '1'
+
+    # file objects cannot be written back
+    with pytest.raises(TypeError):
+        config.a = 5
+
+    assert config.a == '5'
+
+
 def test_read_ini_source_with_subsections(ini_file):
     config = INIFile(ini_file, subsection_token='.')
 
@@ -69,6 +82,10 @@ def test_write_ini_source(ini_file):
 
     assert 'a = 10' in open(ini_file).read()
 
+    assert config.a == '10'
+    assert config.b.d.e == '30'
+    assert config.x.y.z == '50'
+
 
 def test_change_root_name(inimaker):
     config = INIFile(inimaker(u"""
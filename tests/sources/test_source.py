@@ -58,6 +58,78 @@ def test_write_dict_source():
         config.b.d.e
 
 
+@pytest.fixture
+def custom_dict_source():
+    class CustomDictSource(DictSource):
+        def _read(self):
+            data = super(CustomDictSource, self)._read()
+            data['extra'] = 1
+            data['section'] = {'value': 2}
+            return data
+
+        def _write(self, data):
+            del data['extra']
+            del data['section']
+            CustomDictSource.written.append(data)
+            super(CustomDictSource, self)._write(data)
+
+    CustomDictSource.written = []
+    return CustomDictSource
+
+
+def test_read_dict_source_subclass(custom_dict_source):
+    config = custom_dict_source({'a': 1})
+
+    assert config.extra == 1
+    assert config.section.value == 2
+    assert config.make_getter('section', 'value')() == 2
+    assert 'extra' in config
+
+
+def test_write_dict_source_subclass(custom_dict_source):
+    config = custom_dict_source({'a': 1})
+
+    config.a = 10
+    config.update({'b': 2})
+    del config.b
+
+    assert custom_dict_source.written == [
+        {'a': 10},
+        {'a': 10, 'b': 2},
+        {'a': 10},
+    ]
+    assert config.dump() == {'a': 10, 'extra': 1, 'section': {'value': 2}}
+
+
+def test_write_dict_source_without_changing_given_data():
+    data = {'a': 1, 'b': {'c': 2}, 'd': 3}
+    config = DictSource(data)
+
+    config.a = 10
+    config.update({'x': 6})
+    del config.d
+
+    assert config.dump() == {'a': 10, 'b': {'c': 2}, 'x': 6}
+    assert data == {'a': 1, 'b': {'c': 2}, 'd': 3}
+
+
+def test_read_single_keys_from_source():
+    class KeySource(Source):
+        def _read(self):
+            raise AssertionError('whole source must not be read')
+
+        def _read_key(self, key):
+            return {'a': 1, 'b': {'c': 2}}[key]
+
+    config = KeySource()
+
+    assert config.a == 1
+    assert config.b.c == 2
+
+    with pytest.raises(KeyError):
+        config['x']
+
+
 def test_prevent_writing_to_readonly_source():
     class ReadonlySource(Source):
         def _read(self):
@@ -95,6 +167,15 @@ def test_source_get():
     assert 'nonexisting' not in config
 
 
+@pytest.mark.parametrize('cached', [False, True])
+def test_source_contains(cached):
+    config = DictSource({'a': 1, 'b': {'c': 2}}, cached=cached)
+
+    assert 'a' in config
+    assert 'c' in config.b
+    assert 'c' not in config
+
+
 def test_source_items():
     data = {'a': {'b': 1}}
     config = DictSource(data)
@@ -120,6 +201,7 @@ def test_source_items_with_converters():
     (converters.bools('a'), 'yes', True, 'True'),
     (converters.bools('a'), 'No', False, 'False'),
     (converters.bools('a'), '1', True, 'True'),
+    (converters.bools('a'), 'OFF', False, 'False'),
 
     (converters.dates('a'), '2017-10-22',
         datetime.date(2017, 10, 22), '2017-10-22'),
@@ -127,6 +209,10 @@ def test_source_items_with_converters():
     (converters.dates('a', '%d.%m.%Y'), '22.10.2017',
         datetime.date(2017, 10, 22), '22.10.2017'),
 
+    # formats with non-numeric directives
+    (converters.dates('a', '%d %b %Y'), '22 Oct 2017',
+        datetime.date(2017, 10, 22), '22 Oct 2017'),
+
     # use default strict format
     (converters.datetimes('a'), '2017-10-22T10:00:20',
         datetime.datetime(2017, 10, 22, 10, 0, 20), '2017-10-22T10:00:20'),
@@ -147,6 +233,39 @@ def test_builtin_converters(converter, value, customized, reset):
     assert config._data['a'] == reset
 
 
+@pytest.mark.parametrize('value', [
+    '2017-02-30',
+    '2017-10-22T',
+    '22.10.2017',
+])
+def test_builtin_converters_with_invalid_values(value):
+    config = DictSource({'a': value}, converters=[converters.dates('a')])
+
+    with pytest.raises(ValueError):
+        config.a
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('yes', True),
+    ('On', True),
+    ('0', False),
+    ('FALSE', False),
+])
+def test_parse_bool(value, expected):
+    assert converters.parse_bool(value) is expected
+
+    with pytest.raises(ValueError):
+        converters.parse_bool('maybe')
+
+
+def test_bools_converter_accepts_single_value():
+    to_bool = converters.bools('a').customize
+
+    assert to_bool('on') is True
+    with pytest.raises(TypeError):
+        to_bool('on', {})
+
+
 def test_source_keys():
     data = {'a': {'b': 1}}
     config = DictSource(data)
@@ -220,6 +339,18 @@ def test_source_update(container):
     assert config == expected
 
 
+def test_source_update_with_converters():
+    converter_list = [
+        ('a', lambda v: 2 * v, lambda v: v / 2),
+    ]
+    config = DictSource({'a': 1, 'b': 2}, converters=converter_list)
+
+    config.update({'a': 10}, b=20)
+
+    assert config._data == {'a': 5, 'b': 20}
+    assert config.a == 10
+
+
 def test_read_source_with_converters():
     data = {'a': 1, 'b': {'c': 2}}
     converter_list = [
@@ -321,6 +452,99 @@ def test_read_source_with_wildcard_converters():
     assert config.x.c == 60
 
 
+def test_prioritize_converters_by_order_not_position():
+    data = {'a': {'c': 1}}
+    converter_list = [
+        ('c', lambda v: 2 * v, lambda v: v / 2),
+        ('a.*', lambda v: 3 * v, lambda v: v / 3),
+    ]
+    config = DictSource(data, converters=converter_list)
+
+    # both converters fit but the first one has the higher priority
+    # even though the second one matches from the start of the key
+    assert config.a.c == 2
+
+
+def test_read_source_with_many_converters():
+    converter_list = [
+        ('k%d' % index, lambda v, index=index: v + index, lambda v: v)
+        for index in range(150)
+    ]
+    # shadowed by the converters above
+    converter_list.append(('k*', lambda v: -1, lambda v: v))
+
+    data = dict(('k%d' % index, 0) for index in range(151))
+    config = DictSource(data, converters=converter_list)
+
+    assert config.k0 == 0
+    assert config.k99 == 99
+    assert config.k149 == 149
+    assert config.k150 == -1
+
+
+def test_source_getter():
+    data = {'a': 1, 'b': {'c': 2, 'd': {'e': 3}}}
+    converter_list = [
+        ('c', lambda v: 2 * v, lambda v: v / 2),
+    ]
+    config = DictSource(data, converters=converter_list)
+
+    get_a = config.make_getter('a')
+    get_c = config.make_getter('b', 'c')
+    get_e = config.b.make_getter('d', 'e')
+
+    assert get_a() == 1
+    assert get_c() == 4
+    assert get_e() == 3
+    assert config.make_getter('b', 'd')() == {'e': 3}
+
+    data['b']['d']['e'] = 30
+    assert get_e() == 30
+
+    with pytest.raises(KeyError):
+        config.make_getter('b', 'x')()
+
+    with pytest.raises(TypeError):
+        config.make_getter()
+
+
+def test_source_getter_copies_only_the_final_value():
+    class Uncopyable(object):
+        def __deepcopy__(self, memo):
+            raise AssertionError('value was copied')
+
+    config = DictSource({'a': {'b': {'c': 1}, 'd': Uncopyable()}})
+
+    assert config.make_getter('a', 'b', 'c')() == 1
+
+
+def test_source_getter_with_section_converters(mytype_config):
+    MyType, data, config = mytype_config
+
+    get_a = config.make_getter('a')
+
+    assert isinstance(get_a(), MyType)
+    assert get_a().b == 1
+
+
+def test_share_keychains_between_subsections():
+    config = DictSource({'a': {'b': {'c': 1}}})
+
+    assert config.a.b._keychain == ('a', 'b')
+    assert config.a.b._keychain is config.a.b._keychain
+
+
+def test_reuse_subsections_in_use():
+    config = DictSource({'a': {'b': {'c': 1}}})
+    subsection = config.a.b
+
+    assert config.a.b is subsection
+
+    config.a.b = 2
+
+    assert config.a.b == 2
+
+
 def test_read_cached_dict_source():
     data = {'a': 1, 'b': {'c': 2, 'd': {'e': 3}}}
     config = DictSource(data, cached=True)
@@ -345,6 +569,25 @@ def test_read_cached_dict_source():
     assert config.b.d == {'e': 30}
 
 
+def test_reuse_cached_values():
+    customize = pytest.helpers.inspector(lambda v: 2 * v)
+    converter_list = [
+        ('a', customize, lambda v: v / 2),
+    ]
+    config = DictSource({'a': 1, 'b': {'c': 2}}, cached=True,
+                        converters=converter_list)
+
+    assert config.a == 2
+    assert config.a == 2
+    assert config.b is config.b
+    assert customize.calls == 1
+
+    config.a = 10
+
+    assert config.a == 10
+    assert customize.calls == 2
+
+
 def test_write_cached_dict_source():
     config = DictSource({}, cached=True)
 
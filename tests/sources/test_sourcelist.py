@@ -60,6 +60,17 @@ def test_iterate_sources_with_keychain():
     assert list(sources) == [subsource2, subsource1]
 
 
+def test_find_sources_containing_key():
+    source1 = DictSource({'a': 1, 'b': {'c': 2}})
+    source2 = DictSource({'m': 10, 'b': {'o': 20}})
+
+    sources = SourceList(source1, source2)
+
+    assert list(sources.find('a')) == [source1]
+    assert list(sources.find('b')) == [source2, source1]
+    assert list(sources.find('x')) == []
+
+
 def test_add_source_after_instantiation():
     source1 = DictSource({'a': 1, 'b': {'c': 2}})
     source2 = DictSource({'m': 10, 'b': {'o': 20}})
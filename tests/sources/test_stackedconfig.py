@@ -1,10 +1,36 @@
 # -*- coding: utf-8 -*-
 
+import io
+
 import pytest
 
 from configstacker import (DictSource, Environment, INIFile, StackedConfig,
                            strategies)
 
+# shared data of sources. DictSource never changes the given data.
+DATA1 = {'a': 1, 'b': {'c': 2}}
+DATA2 = {'x': 6, 'b': {'y': 7, 'd': {'e': 8}}}
+DATA3 = {'x': 6, 'b': {'y': 7}}
+
+ROOT_A_INI = u"""\
+[__root__]
+a=1000
+"""
+
+
+@pytest.fixture
+def mvp_env(monkeypatch):
+    monkeypatch.setenv('MVP_A', '100')
+
+
+@pytest.fixture(scope='module')
+def basic_stacked():
+    # only for tests that do not change the configuration
+    return StackedConfig(
+        DictSource(DATA1),
+        DictSource(DATA2)
+    )
+
 
 def test_use_dictsource_on_empty_stacked_config():
     config = StackedConfig()
@@ -40,32 +66,37 @@ def test_properly_return_none_values():
     assert config.a is None
 
 
-def test_read_stacked_sources():
+def test_read_stacked_sources(basic_stacked):
+    assert basic_stacked.a == 1
+    assert basic_stacked.x == 6
+    assert basic_stacked.b.c == 2
+    assert basic_stacked.b.y == 7
+
+    assert basic_stacked['a'] == 1
+    assert basic_stacked['x'] == 6
+    assert basic_stacked['b'].c == 2
+    assert basic_stacked.b['y'] == 7
+    assert basic_stacked.b.d.e == 8
+
+
+def test_read_stacked_sources_with_shadowed_values():
     config = StackedConfig(
-        DictSource({'a': 1, 'b': {'c': 2}}),
-        DictSource({'x': 6, 'b': {'y': 7, 'd': {'e': 8}}})
+        DictSource({'a': 1, 'b': 5}),
+        DictSource({'a': {'c': 2}, 'b': {'d': 3}}),
+        DictSource({'b': {'e': 4}}),
     )
 
-    assert config.a == 1
-    assert config.x == 6
-    assert config.b.c == 2
-    assert config.b.y == 7
-
-    assert config['a'] == 1
-    assert config['x'] == 6
-    assert config['b'].c == 2
-    assert config.b['y'] == 7
-    assert config.b.d.e == 8
+    assert config.a.c == 2
+    assert config.b.dump() == {'d': 3, 'e': 4}
 
 
 def test_read_complex_stacked_sources(monkeypatch):
-    monkeypatch.setenv('MVP1_A', '1000')
-    monkeypatch.setenv('MVP2_B_M_E', '4000')
+    pytest.helpers.setenv(monkeypatch, MVP1_A=1000, MVP2_B_M_E=4000)
 
     config = StackedConfig(
         Environment('MVP1_'),  # untyped shadowing
         DictSource({'a': 1, 'b': {'c': 2, 'e': 400}}),
-        DictSource({'x': 6, 'b': {'y': 7, 'd': {'e': 8}}}),
+        DictSource(DATA2),
         DictSource({'a': 100, 'b': {'m': {'e': 800}}}),     # shadowing
         DictSource({'x': 'x', 'b': {'y': 0.7, 'd': 800}}),  # type changing
         Environment('MVP2_'),  # untyped shadowing
@@ -88,13 +119,89 @@ def test_read_complex_stacked_sources(monkeypatch):
     assert "no attribute 'e'" in str(exc_info.value)
 
 
-def test_stacked_len():
+def test_stacked_getter(basic_stacked):
+    assert basic_stacked.make_getter('a')() == 1
+    assert basic_stacked.make_getter('b', 'c')() == 2
+    assert basic_stacked.make_getter('b', 'd', 'e')() == 8
+
+    with pytest.raises(TypeError):
+        basic_stacked.make_getter()
+
+
+def test_read_cached_stacked_sources():
+    source1 = DictSource(DATA1)
+    source2 = DictSource(DATA3)
+    config = StackedConfig(source1, source2, cached=True)
+
+    assert config.a == 1
+    assert config.b is config.b
+
+    # direct changes to the sources are not visible..
+    source1['a'] = 10
+    assert config.a == 1
+
+    # .. until the cache is cleared
+    config.clear_cache()
+    assert config.a == 10
+
+    # writes through the config invalidate the cache of subconfigs too
+    subconfig = config.b
+    assert subconfig.c == 2
+    config.b = {'c': 20}
+    assert subconfig.c == 20
+
+    # as do changes to the source list
+    config.source_list.append(DictSource({'a': 100}))
+    assert config.a == 100
+
+
+def test_reuse_subconfigs_with_same_sources():
+    source1 = DictSource({'a': {'b': 1}})
+    source2 = DictSource({'c': 2})
+    config = StackedConfig(source1, source2)
+
+    subconfig = config.a
+    assert config.a is subconfig
+
+    # the subsection was added to another source
+    source2['a'] = {'d': 3}
+    assert config.a is not subconfig
+    assert config.a.dump() == {'b': 1, 'd': 3}
+
+
+def test_reuse_subconfigs_only_with_same_strategy_map():
     config = StackedConfig(
-        DictSource({'a': 1, 'b': {'c': 2}}),
-        DictSource({'x': 6, 'b': {'y': 7, 'd': {'e': 8}}})
+        DictSource({'b': {'x': 1}}),
+        DictSource({'b': {'x': 2}}),
     )
 
-    assert len(config) == 3
+    subconfig = config.b
+    assert subconfig.x == 2
+
+    config.strategy_map = {'x': strategies.add}
+    assert config.b is not subconfig
+    assert config.b.x == 3
+
+
+def test_read_cached_stacked_sources_with_new_strategy_map():
+    config = StackedConfig(
+        DictSource({'a': 1, 'b': {'x': 1}}),
+        DictSource({'a': 2, 'b': {'x': 2}}),
+        cached=True
+    )
+
+    assert config.a == 2
+    assert config.b.x == 2
+
+    config.strategy_map = {'a': strategies.add, 'x': strategies.add}
+    config.clear_cache()
+
+    assert config.a == 3
+    assert config.b.x == 3
+
+
+def test_stacked_len(basic_stacked):
+    assert len(basic_stacked) == 3
 
 
 def test_write_to_empty_sources():
@@ -111,8 +218,8 @@ def test_write_to_empty_sources():
 
 
 def test_write_stacked_source():
-    source1 = DictSource({'a': 1, 'b': {'c': 2}})
-    source2 = DictSource({'x': 6, 'b': {'y': 7, 'd': {'e': 8}}})
+    source1 = DictSource(DATA1)
+    source2 = DictSource(DATA2)
     config = StackedConfig(source1, source2)
 
     assert config.a == 1
@@ -158,7 +265,7 @@ def test_write_stacked_source_fails(key, message):
 
 def test_get_root():
     config = StackedConfig(
-        DictSource({'x': 6, 'b': {'y': 7, 'd': {'e': 8}}})
+        DictSource(DATA2)
     )
 
     assert config.b.d.get_root() == config
@@ -194,47 +301,44 @@ def test_is_typed(source, typed):
     assert config.is_typed() is typed
 
 
-def test_stacked_get():
-    config = StackedConfig(
-        DictSource({'a': 1, 'b': {'c': 2}}),
-        DictSource({'x': 6, 'b': {'y': 7, 'd': {'e': 8}}})
-    )
-
-    assert config.get('a') == 1
-    assert config.get('x') == 6
-    assert config.get('b').get('c') == 2
-    assert config.get('b').get('y') == 7
-    assert config.get('nonexisting') is None
-    assert config.get('nonexisting', 'default') == 'default'
-    assert 'nonexisting' not in config
+def test_stacked_get(basic_stacked):
+    assert basic_stacked.get('a') == 1
+    assert basic_stacked.get('x') == 6
+    assert basic_stacked.get('b').get('c') == 2
+    assert basic_stacked.get('b').get('y') == 7
+    assert basic_stacked.get('nonexisting') is None
+    assert basic_stacked.get('nonexisting', 'default') == 'default'
+    assert 'nonexisting' not in basic_stacked
 
 
-def test_source_keys():
-    config = StackedConfig(
-        DictSource({'a': 1, 'b': {'c': 2}}),
-        DictSource({'x': 6, 'b': {'y': 7, 'd': {'e': 8}}})
-    )
-
-    keys = list(config.b.keys())
+def test_source_keys(basic_stacked):
+    keys = list(basic_stacked.b.keys())
     assert keys == ['c', 'd', 'y']
 
 
-def test_source_values():
+def test_source_keys_of_sources_with_unsorted_keys(monkeypatch):
+    # keep the order of insertion instead of sorting the keys
+    monkeypatch.setattr(DictSource, 'keys', lambda self: list(self._data))
+
     config = StackedConfig(
-        DictSource({'a': 1, 'b': {'c': 2}}),
-        DictSource({'x': 6, 'b': {'y': 7, 'd': {'e': 8}}})
+        DictSource({'z': 1, 'm': 2}),
+        DictSource({'m': 3, 'a': 4}),
     )
 
-    values = list(config.b.values())
-    assert values == [2, config.b.d, 7]
+    assert config.keys() == ['a', 'm', 'z']
+
+
+def test_source_values(basic_stacked):
+    values = list(basic_stacked.b.values())
+    assert values == [2, basic_stacked.b.d, 7]
 
 
 def test_source_items(monkeypatch):
     monkeypatch.setenv('MVP_A', '10')
     config = StackedConfig(
-        DictSource({'a': 1, 'b': {'c': 2}}),
+        DictSource(DATA1),
         Environment('MVP'),
-        DictSource({'x': 6, 'b': {'y': 7}})
+        DictSource(DATA3)
     )
 
     items = list(config.items())
@@ -266,7 +370,7 @@ def test_reverse_source_order(reverse, values):
 @pytest.mark.parametrize('reverse', (True, False))
 def test_source_items_prevent_shadowing_between_subsections_and_values(reverse):
     sources = [
-        DictSource({'a': 1, 'b': {'c': 2}}),
+        DictSource(DATA1),
         DictSource({'x': 6, 'b': 5}),
     ]
     config = StackedConfig(*sources, reverse=reverse)
@@ -277,18 +381,12 @@ def test_source_items_prevent_shadowing_between_subsections_and_values(reverse):
     assert "conflicts" in str(exc_info.value)
 
 
-def test_source_items_with_strategies_and_untyped_source(monkeypatch, inimaker):
-    monkeypatch.setenv('MVP_A', '100')
-    untyped_source = inimaker(u"""
-        [__root__]
-        a=1000
-    """)
-
+def test_source_items_with_strategies_and_untyped_source(mvp_env):
     config = StackedConfig(
         Environment('MVP'),  # last source still needs a typed source
         DictSource({'a': 1, 'x': [5, 6], 'b': {'c': 2, 'd': [3, 4]}}),
         DictSource({'a': 10, 'x': [50, 60], 'b': {'c': 20, 'd': [30, 40]}}),
-        INIFile(untyped_source),
+        INIFile(io.StringIO(ROOT_A_INI)),
         strategy_map={
             'a': strategies.add,
             'x': strategies.collect,  # keep lists intact
@@ -309,17 +407,45 @@ def test_source_items_with_strategies_and_untyped_source(monkeypatch, inimaker):
 
 def test_stacked_dump():
     config = StackedConfig(
-        DictSource({'a': 1, 'b': {'c': 2}}),
+        DictSource(DATA1),
         DictSource({'a': '10'}),
-        DictSource({'x': 6, 'b': {'y': 7}})
+        DictSource(DATA3)
     )
 
     assert config.dump() == {'a': '10', 'b': {'c': 2, 'y': 7}, 'x': 6}
 
 
+def test_stacked_dump_with_shadowed_values():
+    config = StackedConfig(
+        DictSource({'a': 1, 'b': 5, 'c': {'d': 6}}),
+        DictSource({'a': {'c': 2}, 'b': {'d': 3}, 'c': 7}),
+        DictSource({'b': {'e': 4}}),
+    )
+
+    assert config.dump() == {'a': {'c': 2}, 'b': {'d': 3, 'e': 4}, 'c': 7}
+
+
+def test_stacked_freeze():
+    source1 = DictSource(DATA1)
+    source2 = DictSource({'a': 10})
+    config = StackedConfig(source1, source2)
+
+    frozen = config.freeze()
+
+    assert frozen.dump() == {'a': 10, 'b': {'c': 2}}
+    assert frozen.b.c == 2
+
+    with pytest.raises(TypeError):
+        frozen.a = 100
+
+    # the snapshot is not affected by changes of the sources
+    source2.a = 5
+    assert frozen.a == 10
+
+
 def test_stacked_setdefault():
-    source1 = DictSource({'a': 1, 'b': {'c': 2}})
-    source2 = DictSource({'x': 6, 'b': {'y': 7}})
+    source1 = DictSource(DATA1)
+    source2 = DictSource(DATA3)
     config = StackedConfig(source1, source2)
 
     assert config.setdefault('a', 10) == 1
@@ -336,8 +462,8 @@ def test_stacked_setdefault():
     dict, DictSource
 ])
 def test_stacked_simple_update(container):
-    source1 = DictSource({'a': 1, 'b': {'c': 2}})
-    source2 = DictSource({'x': 6, 'b': {'y': 7}})
+    source1 = DictSource(DATA1)
+    source2 = DictSource(DATA3)
     config = StackedConfig(source1, source2)
 
     data1 = container({'a': 10, 'x': 60})
@@ -360,6 +486,27 @@ def test_stacked_simple_update(container):
     assert source2.b.y == 70
 
 
+def test_stacked_update_writes_each_source_once(monkeypatch):
+    updates = []
+    original_update = DictSource.update
+
+    def update(self, arg, **kwargs):
+        updates.append(arg)
+        original_update(self, arg, **kwargs)
+
+    monkeypatch.setattr(DictSource, 'update', update)
+
+    source1 = DictSource({'a': 1, 'b': 2})
+    source2 = DictSource({'x': 6, 'y': 7})
+    config = StackedConfig(source1, source2)
+
+    config.update({'a': 10, 'b': 20, 'x': 60}, y=70, z=80)
+
+    assert len(updates) == 2
+    assert source1.dump() == {'a': 10, 'b': 20}
+    assert source2.dump() == {'x': 60, 'y': 70, 'z': 80}
+
+
 def test_stacked_config_with_untyped_source(inimaker):
     typed_source1 = {'x': 5, 'b': {'y': 6}}
     typed_source2 = {'a': 1, 'b': {'c': 2}}
@@ -471,36 +618,24 @@ def test_stacked_config_with_untyped_source_and_converters(inimaker):
     assert config.a == 22
 
 
-def test_read_stacked_sources_with_strategies():
-    config = StackedConfig(
+@pytest.mark.parametrize('untyped, expected_a', [
+    (False, 11),
+    (True, 1111),
+])
+def test_read_stacked_sources_with_strategies(request, untyped, expected_a):
+    sources = [
         DictSource({'a': 1, 'x': [5, 6], 'b': {'c': 2, 'd': [3, 4]}}),
         DictSource({'a': 10, 'x': [50, 60], 'b': {'c': 20, 'd': [30, 40]}}),
-        strategy_map={
-            'a': strategies.add,
-            'x': strategies.collect,  # keep lists intact
-            'c': strategies.collect,  # collect values into list
-            'd': strategies.merge,    # merge lists
-        }
-    )
-
-    assert config.a == 11
-    assert config.x == [[50, 60], [5, 6]]
-    assert config.b.c == [20, 2]
-    assert config.b.d == [30, 40, 3, 4]
-
+    ]
 
-def test_read_stacked_sources_with_strategies_and_untyped_sources(monkeypatch, inimaker):
-    monkeypatch.setenv('MVP_A', '100')
-    untyped_source = inimaker(u"""
-        [__root__]
-        a=1000
-    """)
+    if untyped:
+        request.getfixturevalue('mvp_env')
+        # last source still needs a typed source
+        sources.insert(0, Environment('MVP'))
+        sources.append(INIFile(io.StringIO(ROOT_A_INI)))
 
     config = StackedConfig(
-        Environment('MVP'),  # last source still needs a typed source
-        DictSource({'a': 1, 'x': [5, 6], 'b': {'c': 2, 'd': [3, 4]}}),
-        DictSource({'a': 10, 'x': [50, 60], 'b': {'c': 20, 'd': [30, 40]}}),
-        INIFile(untyped_source),
+        *sources,
         strategy_map={
             'a': strategies.add,
             'x': strategies.collect,  # keep lists intact
@@ -509,7 +644,7 @@ def test_read_stacked_sources_with_strategies_and_untyped_sources(monkeypatch, i
         }
     )
 
-    assert config.a == 1111
+    assert config.a == expected_a
     assert config.x == [[50, 60], [5, 6]]
     assert config.b.c == [20, 2]
     assert config.b.d == [30, 40, 3, 4]
@@ -546,9 +681,9 @@ def test_read_stacked_sources_with_joining_strategy():
 
 
 def test_expose_sources_for_manipulation():
-    source1 = DictSource({'a': 1, 'b': {'c': 2}})
+    source1 = DictSource(DATA1)
     source2 = DictSource({'a': 10, 'b': {'c': 20}})
-    source3 = DictSource({'x': 6, 'b': {'y': 7}})
+    source3 = DictSource(DATA3)
     config = StackedConfig()
 
     assert config.dump() == {}
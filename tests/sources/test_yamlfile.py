@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import os
+
 import pytest
 
 from configstacker import YAMLFile
@@ -62,3 +64,39 @@ def test_write_yaml_source(yaml_file):
     config.b.d.e = 30
 
     assert yaml_file.data == expected
+
+
+def test_skip_parsing_unchanged_yaml_source(yaml_file, monkeypatch):
+    load = pytest.helpers.inspector(yaml.load)
+    monkeypatch.setattr(yaml, 'load', load)
+    config = YAMLFile(str(yaml_file.path))
+
+    assert config.a == 1
+    assert config.b.c == 2
+    assert load.calls == 1
+
+    config.a = 10
+
+    assert config.a == 10
+    assert load.calls == 2
+
+
+def test_reparse_rewritten_yaml_source_with_same_mtime(tmpdir):
+    path = tmpdir / 'config.yml'
+    path.write('a: 1')
+    config = YAMLFile(str(path))
+
+    assert config.a == 1
+
+    # rewrite the file with the same size and keep its mtime
+    before = os.stat(str(path))
+    path.write('a: 2')
+    if hasattr(before, 'st_mtime_ns'):
+        os.utime(str(path), ns=(before.st_atime_ns, before.st_mtime_ns))
+    else:
+        os.utime(str(path), (before.st_atime, before.st_mtime))
+
+    after = os.stat(str(path))
+    assert (after.st_mtime, after.st_size) == (before.st_mtime, before.st_size)
+
+    assert config.a == 2
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from configstacker import strategies
+
+
+@pytest.mark.parametrize('strategy', [
+    strategies.add,
+    strategies.collect,
+    strategies.merge,
+    strategies.make_join(),
+    strategies.make_join(', '),
+    # custom strategy
+    lambda previous, next_: next_,
+])
+@pytest.mark.parametrize('values', [
+    [],
+    ['a'],
+    ['a', 'b', 'c'],
+    [5],
+    [[1, 2]],
+])
+def test_reduce_values(strategy, values):
+    expected = strategies.EMPTY
+    for value in values:
+        expected = strategy(expected, value)
+
+    assert strategies.reduce_values(strategy, values) == expected